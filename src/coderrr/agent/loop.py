@@ -16,8 +16,9 @@ interrupt.
 
 from __future__ import annotations
 
+import asyncio
 import platform as platform_mod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass, field
 
 from coderrr.agent.modes import AgentMode
@@ -30,6 +31,7 @@ from coderrr.llm.types import (
     TextBlock,
     TextDelta,
     ToolResultBlock,
+    ToolUseBlock,
     ToolUseStart,
 )
 from coderrr.prompts import system as system_prompt
@@ -58,7 +60,7 @@ def build_system_prompt(ctx: ToolContext) -> str:
     spec_summary = ""
     if ctx.active_spec is not None:
         try:
-            spec = ctx.specs.load(ctx.active_spec)
+            spec = ctx.specs.load(ctx.active_spec, tasks_only=True)
             done, total = spec.progress()
             spec_summary = f"{ctx.active_spec.name} — {spec.title} ({done}/{total} tasks done)"
         except Exception:
@@ -150,21 +152,25 @@ async def run_conversation(
         history.append(response.as_message())
 
         results: list[ToolResultBlock] = []
-        for call in calls:
-            ctx.ui.tool_call(call.name, _preview(call.input))
-            result = await registry.execute(call, ctx)
-            ctx.ui.tool_result(
-                call.name,
-                not result.is_error,
-                result.display or ("error" if result.is_error else ""),
-            )
-            results.append(
-                ToolResultBlock(
-                    tool_use_id=call.id,
-                    content=result.content,
-                    is_error=result.is_error,
+        for batch in _batches(calls, registry):
+            # Every call in a batch is shown before it starts, so the user can
+            # see what is running; the results follow once all of them finish.
+            for call in batch:
+                ctx.ui.tool_call(call.name, _preview(call.input))
+            outcomes = await asyncio.gather(*(registry.execute(call, ctx) for call in batch))
+            for call, result in zip(batch, outcomes, strict=True):
+                ctx.ui.tool_result(
+                    call.name,
+                    not result.is_error,
+                    result.display or ("error" if result.is_error else ""),
+                )
+                results.append(
+                    ToolResultBlock(
+                        tool_use_id=call.id,
+                        content=result.content,
+                        is_error=result.is_error,
+                    )
                 )
-            )
 
         history.append(Message(role="user", content=list(results)))
 
@@ -238,6 +244,28 @@ async def run_task(
     return result
 
 
+def _batches(calls: list[ToolUseBlock], registry: ToolRegistry) -> Iterator[list[ToolUseBlock]]:
+    """Group the model's calls into runs that may execute concurrently.
+
+    Models often ask for several searches in one response. Consecutive calls to
+    tools marked :attr:`~coderrr.tools.base.Tool.concurrent` are gathered
+    together; every other call is a batch of one, which keeps writes, approvals
+    and their order exactly as the model requested.
+    """
+    batch: list[ToolUseBlock] = []
+    for call in calls:
+        tool = registry.get(call.name)
+        if tool is not None and tool.concurrent:
+            batch.append(call)
+            continue
+        if batch:
+            yield batch
+            batch = []
+        yield [call]
+    if batch:
+        yield batch
+
+
 async def _tee_to_console(
     stream: AsyncIterator[StreamEvent], ctx: ToolContext
 ) -> AsyncIterator[StreamEvent]:
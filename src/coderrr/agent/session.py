@@ -187,7 +187,7 @@ class Session:
             )
             return False
 
-        if not self.specs.load(ref).tasks:
+        if not self.specs.load(ref, tasks_only=True).tasks:
             self.ui.warning(f"Spec {ref.name} contains no tasks. Nothing to execute.")
             return False
 
@@ -286,7 +286,7 @@ class Session:
         ref = self.ctx.active_spec
         if ref is None:
             return
-        spec = self.specs.load(ref)
+        spec = self.specs.load(ref, tasks_only=True)
         done, total = spec.progress()
         blocked = [t for t in spec.tasks if t.status is TaskStatus.BLOCKED]
 
@@ -314,13 +314,15 @@ class Session:
         self.registry.register_all(self.mcp.tools())
 
     async def aclose(self) -> None:
-        """Release MCP connections, skills and sandbox state."""
+        """Release MCP and provider connections, skills and sandbox state."""
         # Order matters: the bridged tools must leave the registry before the
         # connections underneath them close, or a retry could offer the model a
         # tool whose transport is already gone.
         self.registry.drop_class(ToolClass.EXTERNAL)
         with contextlib.suppress(Exception):  # teardown must never raise
             await self.mcp.aclose()
+        with contextlib.suppress(Exception):
+            await self.provider.aclose()
         self.cleanup()
 
     def cleanup(self) -> None:
@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 import platform as platform_mod
 import sys
-import webbrowser
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -468,6 +467,8 @@ def _run_login(ui: Console, name: str, server: McpServerConfig, *, browser: bool
 
     def show(url: str) -> None:
         if browser:
+            import webbrowser
+
             ui.info("Opening your browser to authorize...")
             webbrowser.open(url)
             ui.print(f"  [dim]If it did not open: {url}[/]")
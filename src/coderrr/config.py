@@ -12,6 +12,7 @@ import contextlib
 import os
 import re
 import sys
+import tempfile
 from pathlib import Path
 from typing import Any, Literal
 
@@ -332,21 +333,38 @@ def save_config(config: Config, path: Path | None = None) -> Path:
     else:
         _prune_servers(payload["mcp"]["servers"])
 
-    data = tomli_w.dumps(payload).encode("utf-8")
+    write_private(target, tomli_w.dumps(payload).encode("utf-8"))
+    return target
+
+
+def write_private(target: Path, data: bytes) -> None:
+    """Replace ``target`` with ``data`` atomically, readable by the owner only.
+
+    The bytes go to a sibling temp file that is then renamed over the target, so
+    a crash mid-write leaves the previous file intact rather than a truncated
+    one -- and a truncated config silently loads as the defaults. ``mkstemp``
+    creates the file 0600 from the outset rather than chmod-ing after writing,
+    which would leave a window where a key is world-readable.
 
-    # Create with 0600 from the outset rather than chmod-ing after writing,
-    # which would leave a window where the key is world-readable.
-    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    A symlinked target is followed, so the rename lands on the real file and
+    the link survives -- dotfile managers keep config files that way.
+    """
+    target = Path(os.path.realpath(target))
+    fd, temp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
     try:
-        os.write(fd, data)
-    finally:
-        os.close(fd)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp)
+        raise
 
     with contextlib.suppress(OSError):  # pragma: no cover - Windows
         os.chmod(target, 0o600)
 
-    return target
-
 
 def config_path() -> Path:
     return CONFIG_FILE
@@ -14,7 +14,7 @@ from typing import Any
 
 import httpx
 
-from coderrr.llm.base import ProviderError
+from coderrr.llm.base import ProviderError, SharedClient
 from coderrr.llm.types import (
     Message,
     MessageStop,
@@ -96,6 +96,7 @@ class AnthropicProvider:
         self.api_key = api_key
         self.endpoint = endpoint.rstrip("/")
         self.timeout = timeout
+        self._http = SharedClient()
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -104,6 +105,9 @@ class AnthropicProvider:
             "anthropic-version": API_VERSION,
         }
 
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
     async def stream(
         self,
         *,
@@ -132,77 +136,76 @@ class AnthropicProvider:
         input_tokens = 0
         output_tokens = 0
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                async with client.stream(
-                    "POST",
-                    f"{self.endpoint}/messages",
-                    headers=self._headers(),
-                    json=payload,
-                ) as response:
-                    if response.status_code >= 400:
-                        body = (await response.aread()).decode("utf-8", "replace")
+        client = self._http.get()
+        try:
+            async with client.stream(
+                "POST",
+                f"{self.endpoint}/messages",
+                headers=self._headers(),
+                json=payload,
+                timeout=self.timeout,
+            ) as response:
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode("utf-8", "replace")
+                    raise ProviderError(f"anthropic returned {response.status_code}: {body[:500]}")
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if not data:
+                        continue
+                    try:
+                        event = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+
+                    etype = event.get("type")
+
+                    if etype == "message_start":
+                        u = (event.get("message") or {}).get("usage") or {}
+                        input_tokens = u.get("input_tokens", 0)
+                        output_tokens = u.get("output_tokens", 0)
+
+                    elif etype == "content_block_start":
+                        index = event.get("index", 0)
+                        block = event.get("content_block") or {}
+                        if block.get("type") == "tool_use":
+                            index_to_id[index] = block.get("id", f"tool_{index}")
+                            yield ToolUseStart(
+                                id=index_to_id[index],
+                                name=block.get("name", ""),
+                            )
+
+                    elif etype == "content_block_delta":
+                        index = event.get("index", 0)
+                        delta = event.get("delta") or {}
+                        dtype = delta.get("type")
+                        if dtype == "text_delta" and delta.get("text"):
+                            yield TextDelta(delta["text"])
+                        elif dtype == "input_json_delta":
+                            partial = delta.get("partial_json", "")
+                            if partial and index in index_to_id:
+                                yield ToolUseDelta(id=index_to_id[index], partial_json=partial)
+
+                    elif etype == "message_delta":
+                        delta = event.get("delta") or {}
+                        if delta.get("stop_reason"):
+                            stop_reason = _STOP_REASONS.get(delta["stop_reason"], "end_turn")
+                        u = event.get("usage") or {}
+                        if u.get("output_tokens"):
+                            output_tokens = u["output_tokens"]
+
+                    elif etype == "error":
+                        err = event.get("error") or {}
                         raise ProviderError(
-                            f"anthropic returned {response.status_code}: {body[:500]}"
+                            f"anthropic stream error: {err.get('message', 'unknown')}"
                         )
-
-                    async for line in response.aiter_lines():
-                        if not line.startswith("data:"):
-                            continue
-                        data = line[5:].strip()
-                        if not data:
-                            continue
-                        try:
-                            event = json.loads(data)
-                        except json.JSONDecodeError:
-                            continue
-
-                        etype = event.get("type")
-
-                        if etype == "message_start":
-                            u = (event.get("message") or {}).get("usage") or {}
-                            input_tokens = u.get("input_tokens", 0)
-                            output_tokens = u.get("output_tokens", 0)
-
-                        elif etype == "content_block_start":
-                            index = event.get("index", 0)
-                            block = event.get("content_block") or {}
-                            if block.get("type") == "tool_use":
-                                index_to_id[index] = block.get("id", f"tool_{index}")
-                                yield ToolUseStart(
-                                    id=index_to_id[index],
-                                    name=block.get("name", ""),
-                                )
-
-                        elif etype == "content_block_delta":
-                            index = event.get("index", 0)
-                            delta = event.get("delta") or {}
-                            dtype = delta.get("type")
-                            if dtype == "text_delta" and delta.get("text"):
-                                yield TextDelta(delta["text"])
-                            elif dtype == "input_json_delta":
-                                partial = delta.get("partial_json", "")
-                                if partial and index in index_to_id:
-                                    yield ToolUseDelta(id=index_to_id[index], partial_json=partial)
-
-                        elif etype == "message_delta":
-                            delta = event.get("delta") or {}
-                            if delta.get("stop_reason"):
-                                stop_reason = _STOP_REASONS.get(delta["stop_reason"], "end_turn")
-                            u = event.get("usage") or {}
-                            if u.get("output_tokens"):
-                                output_tokens = u["output_tokens"]
-
-                        elif etype == "error":
-                            err = event.get("error") or {}
-                            raise ProviderError(
-                                f"anthropic stream error: {err.get('message', 'unknown')}"
-                            )
-            except httpx.HTTPError as exc:
-                # Timeout/read errors stringify to "", so fall back to the class
-                # name to avoid an empty "request failed:" message.
-                detail = str(exc).strip() or type(exc).__name__
-                raise ProviderError(f"anthropic request failed: {detail}") from exc
+        except httpx.HTTPError as exc:
+            # Timeout/read errors stringify to "", so fall back to the class
+            # name to avoid an empty "request failed:" message.
+            detail = str(exc).strip() or type(exc).__name__
+            raise ProviderError(f"anthropic request failed: {detail}") from exc
 
         yield MessageStop(
             stop_reason=stop_reason,
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from collections.abc import AsyncIterator
 from typing import Protocol, runtime_checkable
 
+import httpx
+
 from coderrr.llm.types import (
     Block,
     LLMResponse,
@@ -50,6 +53,39 @@ class Provider(Protocol):
         temperature: float = 0.2,
     ) -> AsyncIterator[StreamEvent]: ...
 
+    async def aclose(self) -> None:
+        """Release pooled connections. The provider stays usable afterwards."""
+
+
+class SharedClient:
+    """One keep-alive ``httpx.AsyncClient`` reused across a provider's calls.
+
+    Every turn of the agent loop is a request to the same host, and a fresh
+    client per turn paid a TCP and TLS handshake each time. The client is tied
+    to the event loop that created it -- the REPL runs each request under its own
+    ``asyncio.run`` -- so a call from a different loop gets a new one rather
+    than a pool whose connections belong to a loop that no longer exists.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient()
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        client, loop = self._client, self._loop
+        self._client = self._loop = None
+        # A client from an earlier loop cannot be closed from this one; its
+        # connections died with that loop.
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
+
 
 async def collect(stream: AsyncIterator[StreamEvent]) -> LLMResponse:
     """Drain a stream into a complete :class:`LLMResponse`.
@@ -18,7 +18,7 @@ from typing import Any
 
 import httpx
 
-from coderrr.llm.base import ProviderError
+from coderrr.llm.base import ProviderError, SharedClient
 from coderrr.llm.schema import flatten_refs
 from coderrr.llm.types import (
     Message,
@@ -122,6 +122,10 @@ class GoogleProvider:
         self.api_key = api_key
         self.endpoint = endpoint.rstrip("/")
         self.timeout = timeout
+        self._http = SharedClient()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
 
     async def stream(
         self,
@@ -150,58 +154,59 @@ class GoogleProvider:
         usage = Usage()
         call_index = 0
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                async with client.stream(
-                    "POST",
-                    url,
-                    params={"alt": "sse", "key": self.api_key},
-                    headers={"Content-Type": "application/json"},
-                    json=payload,
-                ) as response:
-                    if response.status_code >= 400:
-                        body = (await response.aread()).decode("utf-8", "replace")
-                        raise ProviderError(f"google returned {response.status_code}: {body[:500]}")
-
-                    async for line in response.aiter_lines():
-                        if not line.startswith("data:"):
-                            continue
-                        data = line[5:].strip()
-                        if not data:
-                            continue
-                        try:
-                            chunk = json.loads(data)
-                        except json.JSONDecodeError:
-                            continue
-
-                        if meta := chunk.get("usageMetadata"):
-                            usage = Usage(
-                                input_tokens=meta.get("promptTokenCount", 0),
-                                output_tokens=meta.get("candidatesTokenCount", 0),
-                            )
-
-                        for candidate in chunk.get("candidates", []):
-                            if reason := candidate.get("finishReason"):
-                                stop_reason = _FINISH_REASONS.get(reason, "end_turn")
-
-                            content = candidate.get("content") or {}
-                            for part in content.get("parts", []):
-                                if part.get("text"):
-                                    yield TextDelta(part["text"])
-                                elif fc := part.get("functionCall"):
-                                    # Args arrive complete, not fragmented.
-                                    call_id = f"call_{call_index}"
-                                    call_index += 1
-                                    yield ToolUseStart(id=call_id, name=fc.get("name", ""))
-                                    yield ToolUseDelta(
-                                        id=call_id,
-                                        partial_json=json.dumps(fc.get("args") or {}),
-                                    )
-                                    stop_reason = "tool_use"
-            except httpx.HTTPError as exc:
-                # Timeout/read errors stringify to "", so fall back to the class
-                # name to avoid an empty "request failed:" message.
-                detail = str(exc).strip() or type(exc).__name__
-                raise ProviderError(f"google request failed: {detail}") from exc
+        client = self._http.get()
+        try:
+            async with client.stream(
+                "POST",
+                url,
+                params={"alt": "sse", "key": self.api_key},
+                headers={"Content-Type": "application/json"},
+                json=payload,
+                timeout=self.timeout,
+            ) as response:
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode("utf-8", "replace")
+                    raise ProviderError(f"google returned {response.status_code}: {body[:500]}")
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if not data:
+                        continue
+                    try:
+                        chunk = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+
+                    if meta := chunk.get("usageMetadata"):
+                        usage = Usage(
+                            input_tokens=meta.get("promptTokenCount", 0),
+                            output_tokens=meta.get("candidatesTokenCount", 0),
+                        )
+
+                    for candidate in chunk.get("candidates", []):
+                        if reason := candidate.get("finishReason"):
+                            stop_reason = _FINISH_REASONS.get(reason, "end_turn")
+
+                        content = candidate.get("content") or {}
+                        for part in content.get("parts", []):
+                            if part.get("text"):
+                                yield TextDelta(part["text"])
+                            elif fc := part.get("functionCall"):
+                                # Args arrive complete, not fragmented.
+                                call_id = f"call_{call_index}"
+                                call_index += 1
+                                yield ToolUseStart(id=call_id, name=fc.get("name", ""))
+                                yield ToolUseDelta(
+                                    id=call_id,
+                                    partial_json=json.dumps(fc.get("args") or {}),
+                                )
+                                stop_reason = "tool_use"
+        except httpx.HTTPError as exc:
+            # Timeout/read errors stringify to "", so fall back to the class
+            # name to avoid an empty "request failed:" message.
+            detail = str(exc).strip() or type(exc).__name__
+            raise ProviderError(f"google request failed: {detail}") from exc
 
         yield MessageStop(stop_reason=stop_reason, usage=usage)
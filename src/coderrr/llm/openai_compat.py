@@ -14,7 +14,7 @@ from typing import Any
 
 import httpx
 
-from coderrr.llm.base import ProviderError
+from coderrr.llm.base import ProviderError, SharedClient
 from coderrr.llm.types import (
     Message,
     MessageStop,
@@ -116,6 +116,7 @@ class OpenAICompatProvider:
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self._http = SharedClient()
         self.extra_headers = extra_headers or {}
 
     def _headers(self) -> dict[str, str]:
@@ -125,6 +126,9 @@ class OpenAICompatProvider:
             headers["Authorization"] = f"Bearer {self.api_key}"
         return headers
 
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
     async def stream(
         self,
         *,
@@ -156,68 +160,67 @@ class OpenAICompatProvider:
         stop_reason: StopReason = "end_turn"
         usage = Usage()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                async with client.stream(
-                    "POST",
-                    f"{self.endpoint}/chat/completions",
-                    headers=self._headers(),
-                    json=payload,
-                ) as response:
-                    if response.status_code >= 400:
-                        body = (await response.aread()).decode("utf-8", "replace")
-                        raise ProviderError(
-                            f"{self.name} returned {response.status_code}: {body[:500]}"
+        client = self._http.get()
+        try:
+            async with client.stream(
+                "POST",
+                f"{self.endpoint}/chat/completions",
+                headers=self._headers(),
+                json=payload,
+                timeout=self.timeout,
+            ) as response:
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode("utf-8", "replace")
+                    raise ProviderError(
+                        f"{self.name} returned {response.status_code}: {body[:500]}"
+                    )
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if not data or data == "[DONE]":
+                        continue
+                    try:
+                        chunk = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+
+                    if chunk.get("usage"):
+                        u = chunk["usage"]
+                        usage = Usage(
+                            input_tokens=u.get("prompt_tokens", 0),
+                            output_tokens=u.get("completion_tokens", 0),
                         )
 
-                    async for line in response.aiter_lines():
-                        if not line.startswith("data:"):
-                            continue
-                        data = line[5:].strip()
-                        if not data or data == "[DONE]":
-                            continue
-                        try:
-                            chunk = json.loads(data)
-                        except json.JSONDecodeError:
-                            continue
-
-                        if chunk.get("usage"):
-                            u = chunk["usage"]
-                            usage = Usage(
-                                input_tokens=u.get("prompt_tokens", 0),
-                                output_tokens=u.get("completion_tokens", 0),
-                            )
-
-                        for choice in chunk.get("choices", []):
-                            if choice.get("finish_reason"):
-                                stop_reason = _FINISH_REASONS.get(
-                                    choice["finish_reason"], "end_turn"
-                                )
+                    for choice in chunk.get("choices", []):
+                        if choice.get("finish_reason"):
+                            stop_reason = _FINISH_REASONS.get(choice["finish_reason"], "end_turn")
+
+                        delta = choice.get("delta") or {}
+                        if delta.get("content"):
+                            yield TextDelta(delta["content"])
 
-                            delta = choice.get("delta") or {}
-                            if delta.get("content"):
-                                yield TextDelta(delta["content"])
-
-                            for call in delta.get("tool_calls") or []:
-                                index = call.get("index", 0)
-                                fn = call.get("function") or {}
-
-                                if index not in seen_index:
-                                    call_id = call.get("id") or f"call_{index}"
-                                    seen_index[index] = call_id
-                                    yield ToolUseStart(id=call_id, name=fn.get("name") or "")
-
-                                if fn.get("arguments"):
-                                    yield ToolUseDelta(
-                                        id=seen_index[index],
-                                        partial_json=fn["arguments"],
-                                    )
-            except httpx.HTTPError as exc:
-                # Timeout/read errors (httpx.ReadTimeout, ConnectTimeout, ...)
-                # stringify to "", so fall back to the class name to avoid an
-                # empty "request failed:" message.
-                detail = str(exc).strip() or type(exc).__name__
-                raise ProviderError(f"{self.name} request failed: {detail}") from exc
+                        for call in delta.get("tool_calls") or []:
+                            index = call.get("index", 0)
+                            fn = call.get("function") or {}
+
+                            if index not in seen_index:
+                                call_id = call.get("id") or f"call_{index}"
+                                seen_index[index] = call_id
+                                yield ToolUseStart(id=call_id, name=fn.get("name") or "")
+
+                            if fn.get("arguments"):
+                                yield ToolUseDelta(
+                                    id=seen_index[index],
+                                    partial_json=fn["arguments"],
+                                )
+        except httpx.HTTPError as exc:
+            # Timeout/read errors (httpx.ReadTimeout, ConnectTimeout, ...)
+            # stringify to "", so fall back to the class name to avoid an
+            # empty "request failed:" message.
+            detail = str(exc).strip() or type(exc).__name__
+            raise ProviderError(f"{self.name} request failed: {detail}") from exc
 
         # A model that emitted tool calls is requesting execution even when the
         # endpoint reports a generic finish reason -- Ollama does this.
@@ -182,8 +182,10 @@ def render_result(result: McpCallResult, *, server: str, limit: int) -> tuple[st
 
 
 def _dump(value: Any) -> str:
+    # Compact, because the reader is a model: indentation and escaped non-ASCII
+    # cost tokens and eat into the size limit without telling it anything.
     try:
-        return json.dumps(value, indent=2, default=str)
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
     except (TypeError, ValueError):
         return str(value)
 
@@ -18,14 +18,13 @@ from __future__ import annotations
 
 import contextlib
 import json
-import os
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 import httpx
 
-from coderrr.config import CONFIG_DIR, KEYRING_SERVICE
+from coderrr.config import CONFIG_DIR, KEYRING_SERVICE, write_private
 from coderrr.mcp import oauth
 from coderrr.mcp.oauth import ClientRegistration, StoredAuth, TokenSet
 from coderrr.mcp.types import McpError
@@ -45,6 +44,13 @@ class CredentialStore:
     #: Set False in tests, and by anyone who wants everything in one file.
     use_keyring: bool = True
 
+    #: The parsed file, keyed on what ``stat`` said when it was read. ``doctor``
+    #: and ``/mcp`` ask about every configured server in turn; without this each
+    #: question re-reads and re-parses the same file.
+    _parsed: tuple[tuple[int, int, int], dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # -- public ----------------------------------------------------------
 
     def load(self, server: str) -> StoredAuth | None:
@@ -129,13 +135,19 @@ class CredentialStore:
     # -- file ------------------------------------------------------------
 
     def _read_all(self) -> dict[str, Any]:
-        if not self.path.exists():
-            return {}
         try:
-            payload = json.loads(self.path.read_text(encoding="utf-8"))
-        except (OSError, ValueError):
+            info = self.path.stat()
+        except OSError:
             return {}
-        return payload if isinstance(payload, dict) else {}
+        key = (info.st_mtime_ns, info.st_size, info.st_ino)
+        if self._parsed is None or self._parsed[0] != key:
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return {}
+            self._parsed = (key, payload if isinstance(payload, dict) else {})
+        # A copy, because the write paths edit what they are given.
+        return dict(self._parsed[1])
 
     def _read_file(self, server: str) -> dict[str, Any] | None:
         entry = self._read_all().get(server)
@@ -158,21 +170,20 @@ class CredentialStore:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         data = json.dumps(everything, indent=2).encode("utf-8")
 
-        # Opened 0600 from the outset rather than chmod-ed afterwards, which
-        # would leave a window where a refresh token is world-readable.
+        # Written 0600 through a temp file and renamed into place, so a crash
+        # mid-write cannot leave a truncated file that drops every server's
+        # tokens at once.
         #
         # POSIX only. Windows ignores the mode beyond its read-only bit, so there
         # the file is protected by the user-profile ACL rather than by us -- one
         # more reason the keyring is tried first, and it is the usual path on
         # Windows because Credential Manager is always present.
-        descriptor = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        try:
-            os.write(descriptor, data)
-        finally:
-            os.close(descriptor)
+        write_private(self.path, data)
 
-        with contextlib.suppress(OSError):  # pragma: no cover - Windows
-            os.chmod(self.path, 0o600)
+        self._parsed = None
+        with contextlib.suppress(OSError):
+            info = self.path.stat()
+            self._parsed = ((info.st_mtime_ns, info.st_size, info.st_ino), everything)
 
 
 @dataclass
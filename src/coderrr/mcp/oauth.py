@@ -32,7 +32,6 @@ import hashlib
 import json
 import secrets
 import time
-import webbrowser
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field, replace
 from typing import Any
@@ -784,6 +783,8 @@ async def ensure_fresh(
 
 
 def _open_browser(url: str) -> None:
+    import webbrowser
+
     webbrowser.open(url)
 
 
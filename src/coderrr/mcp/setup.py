@@ -53,6 +53,8 @@ _GENERIC = frozenset(
     }
 )
 
+_NON_ALNUM = re.compile(r"[^A-Za-z0-9]+")
+
 
 def looks_like_url(value: str) -> bool:
     """True for something that could actually be requested over HTTP."""
@@ -135,11 +137,7 @@ def suggest_name(target: list[str]) -> str:
     for token in target:
         if token.startswith("-"):
             continue
-        words = [
-            word
-            for word in re.split(r"[^A-Za-z0-9]+", token)
-            if word and word.lower() not in _GENERIC
-        ]
+        words = [word for word in _NON_ALNUM.split(token) if word and word.lower() not in _GENERIC]
         if words:
             return sanitize(words[-1]).lower()
     return ""
@@ -205,6 +205,20 @@ happened to read into your output.
 """
 
 
+_SEPARATOR = "\n\n---\n\n"
+
+
+def _preamble(mode: AgentMode) -> str:
+    workflow = WORKFLOW_PLANNING if mode is AgentMode.PLANNING else WORKFLOW_EXECUTION
+    sections = (IDENTITY, OUTPUT, PRINCIPLES, CODE, TOOL_POLICY, workflow, SYSTEM_TOOLS, SAFETY)
+    return _SEPARATOR.join(section.strip() for section in sections)
+
+
+#: The fixed sections, joined once per mode at import. The prompt is rebuilt
+#: every turn, and only the environment and the trailing blocks ever change.
+_PREAMBLES = {mode: _preamble(mode) for mode in AgentMode}
+
+
 def render(
     mode: AgentMode,
     *,
@@ -220,17 +234,8 @@ def render(
     Only the workflow section for the current mode is included -- describing the
     other half would spend tokens on tools the model cannot call.
     """
-    workflow = WORKFLOW_PLANNING if mode is AgentMode.PLANNING else WORKFLOW_EXECUTION
-
     sections = [
-        IDENTITY,
-        OUTPUT,
-        PRINCIPLES,
-        CODE,
-        TOOL_POLICY,
-        workflow,
-        SYSTEM_TOOLS,
-        SAFETY,
+        _PREAMBLES[mode],
         "# Environment\n"
         f"- Workspace: {workspace}\n"
         f"- Platform: {platform}\n"
@@ -257,4 +262,4 @@ def render(
     if extra:
         sections.append(extra)
 
-    return "\n\n---\n\n".join(section.strip() for section in sections if section.strip())
+    return _SEPARATOR.join(section.strip() for section in sections if section.strip())
@@ -31,6 +31,7 @@ markdown -- see :mod:`coderrr.skills.loader` for why ``tools/`` is not used.
 
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass, field
 from typing import Any
@@ -186,9 +187,13 @@ class SkillIndex:
         return cls(version=str(payload.get("version") or ""), skills=skills)
 
     def search(self, query: str, *, limit: int = 5) -> list[SkillInfo]:
-        scored = [(skill.matches(query), skill) for skill in self.skills.values()]
-        ranked = sorted(scored, key=lambda pair: (-pair[0], pair[1].name))
-        return [skill for score, skill in ranked if score > 0][:limit]
+        scored = [
+            (-score, skill.name, skill)
+            for skill in self.skills.values()
+            if (score := skill.matches(query)) > 0
+        ]
+        # Only the best few are ever shown; no need to order the whole index.
+        return [skill for _, _, skill in heapq.nsmallest(limit, scored, key=lambda t: t[:2])]
 
     def get(self, name: str) -> SkillInfo | None:
         return self.skills.get(name)
@@ -182,9 +182,15 @@ class SpecStore:
         (directory / "tasks.md").write_text(render_tasks(title, []), encoding="utf-8")
         return ref
 
-    def load(self, ref: SpecRef) -> Spec:
-        requirements = self._read(ref.path / "requirements.md")
-        design = self._read(ref.path / "design.md")
+    def load(self, ref: SpecRef, *, tasks_only: bool = False) -> Spec:
+        """Read a spec back from disk.
+
+        ``tasks_only`` leaves ``requirements`` and ``design`` empty. Progress
+        checks run every turn and after every task update, and never look at
+        the prose documents, which are usually the bulk of the spec.
+        """
+        requirements = "" if tasks_only else self._read(ref.path / "requirements.md")
+        design = "" if tasks_only else self._read(ref.path / "design.md")
         tasks_md = self._read(ref.path / "tasks.md")
         title, tasks = parse_tasks(tasks_md)
         return Spec(
@@ -217,7 +223,7 @@ class SpecStore:
         status: TaskStatus | None = None,
         notes: str | None = None,
     ) -> Task:
-        spec = self.load(ref)
+        spec = self.load(ref, tasks_only=True)
         task = spec.task(task_id)
         if task is None:
             known = ", ".join(t.id for t in spec.tasks) or "none"
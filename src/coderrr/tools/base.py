@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -40,6 +41,20 @@ class ToolResult:
         return cls(content=message, is_error=True, display=message.splitlines()[0])
 
 
+@cache
+def _input_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """The provider-facing schema for ``model``, built once per class.
+
+    Every turn re-exposes every tool, and pydantic regenerates the schema from
+    scratch on each call. ``Input`` classes are fixed at import time, so the
+    result never changes. Callers must treat it as read-only.
+    """
+    schema = model.model_json_schema()
+    # Providers only need the object shape; the generated title is noise.
+    schema.pop("title", None)
+    return schema
+
+
 def _empty_mcp() -> McpManager:
     """A manager with no servers.
 
@@ -105,19 +120,20 @@ class Tool(ABC):
     description: ClassVar[str]
     klass: ClassVar[ToolClass]
     Input: ClassVar[type[BaseModel]]
+    #: Safe to run alongside other calls from the same response, and actually
+    #: yields while working. Only read-only tools that do their I/O off the event
+    #: loop qualify; a tool that blocks inline would gain nothing from it.
+    concurrent: ClassVar[bool] = False
 
     @abstractmethod
     async def run(self, inp: Any, ctx: ToolContext) -> ToolResult:
         """Execute. ``inp`` is whatever :meth:`validate_input` returned."""
 
     def spec(self) -> ToolSpec:
-        schema = self.Input.model_json_schema()
-        # Providers only need the object shape; the generated title is noise.
-        schema.pop("title", None)
         return ToolSpec(
             name=self.name,
             description=self.description.strip(),
-            input_schema=schema,
+            input_schema=_input_schema(self.Input),
             klass=self.klass,
         )
 
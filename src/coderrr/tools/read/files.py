@@ -7,6 +7,7 @@ model needs to know about reading files must live in these schemas.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -40,9 +41,12 @@ SKIP_DIRS = frozenset(
 
 MAX_READ_BYTES = 400_000
 
+#: How much of a file's head is checked for NUL bytes to call it binary.
+BINARY_SNIFF_BYTES = 8192
 
-def _looks_binary(data: bytes) -> bool:
-    return b"\x00" in data[:8192]
+
+def looks_binary(data: bytes) -> bool:
+    return b"\x00" in data[:BINARY_SNIFF_BYTES]
 
 
 class ReadFileInput(BaseModel):
@@ -77,7 +81,7 @@ class ReadFile(Tool):
         except OSError as exc:
             return ToolResult.error(f"Could not read {inp.path}: {exc}")
 
-        if _looks_binary(raw):
+        if looks_binary(raw):
             return ToolResult.error(f"{inp.path} appears to be a binary file.")
         if len(raw) > MAX_READ_BYTES:
             return ToolResult.error(
@@ -123,7 +127,9 @@ class ListDir(Tool):
 
         entries: list[str] = []
         try:
-            for entry in sorted(target.iterdir(), key=lambda p: (p.is_file(), p.name)):
+            with os.scandir(target) as listing:
+                children = sorted(listing, key=lambda e: (e.is_file(), e.name))
+            for entry in children:
                 if entry.name in SKIP_DIRS:
                     continue
                 if entry.is_dir():
@@ -175,15 +181,18 @@ class Tree(Tool):
         return ToolResult.ok("\n".join(lines), display=f"{inp.path} ({len(lines)} rows)")
 
     def _walk(
-        self, directory: Path, prefix: str, depth: int, inp: TreeInput, out: list[str]
+        self, directory: str | Path, prefix: str, depth: int, inp: TreeInput, out: list[str]
     ) -> bool:
         if depth >= inp.max_depth:
             return False
+        # scandir entries carry their type from the directory read itself, so
+        # sorting and rendering cost no stat call per entry, as Path would.
         try:
-            entries = sorted(
-                (e for e in directory.iterdir() if e.name not in SKIP_DIRS),
-                key=lambda p: (p.is_file(), p.name),
-            )
+            with os.scandir(directory) as listing:
+                entries = sorted(
+                    (e for e in listing if e.name not in SKIP_DIRS),
+                    key=lambda e: (e.is_file(), e.name),
+                )
         except OSError:
             return False
 
@@ -192,9 +201,10 @@ class Tree(Tool):
                 return True
             last = index == len(entries) - 1
             connector = "└── " if last else "├── "
-            out.append(f"{prefix}{connector}{entry.name}{'/' if entry.is_dir() else ''}")
-            if entry.is_dir():
+            is_dir = entry.is_dir()
+            out.append(f"{prefix}{connector}{entry.name}{'/' if is_dir else ''}")
+            if is_dir:
                 extension = "    " if last else "│   "
-                if self._walk(entry, prefix + extension, depth + 1, inp, out):
+                if self._walk(entry.path, prefix + extension, depth + 1, inp, out):
                     return True
         return False
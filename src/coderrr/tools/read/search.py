@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import fnmatch
+import os
 import re
+import threading
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -11,10 +15,32 @@ from pydantic import BaseModel, Field
 from coderrr.llm.types import ToolClass
 from coderrr.policy.paths import PathPolicyError, resolve_read
 from coderrr.tools.base import Tool, ToolContext, ToolResult
-from coderrr.tools.read.files import SKIP_DIRS
+from coderrr.tools.read.files import BINARY_SNIFF_BYTES, SKIP_DIRS, looks_binary
 
 MAX_FILE_BYTES = 2_000_000
 
+#: fnmatch folds case wherever the platform's paths do; the precompiled glob
+#: has to as well, or '*.PY' would stop matching on Windows.
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+#: Constructs whose meaning depends on where the subject string ends: lookaround,
+#: string anchors, atomic groups and possessive quantifiers. A pattern using any
+#: of them can match a line on its own yet not the same line inside the file.
+_LINE_SENSITIVE = re.compile(r"\(\?<?[=!>]|\\[AZ]|[*+?}]\+")
+
+#: Elements that can consume a newline: negated classes, ``\s``/``\W``/``\D``,
+#: escapes that can spell one (or start a class range that spans one), inline
+#: DOTALL and raw control characters. Deliberately conservative. A repeat of any
+#: of them that finds no terminator runs from every start position to the end
+#: of the file, which over a whole file is quadratic; confined to one line it is
+#: bounded by the line.
+_MAY_CROSS_LINES = re.compile(r"\[\^|\\[sWDnNxuUtrvfa0-9]|\[[^\]]*\\b|\(\?[-a-zA-Z]*s|[\x00-\x1f]")
+
+#: Line breaks str.splitlines honours that a multiline ``^``/``$`` does not.
+#: Line endings are normalized on read, so ``\r`` never reaches here. Checked
+#: with ``in`` per character, which is several times faster than a class regex.
+_OTHER_BREAKS = "\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
 
 class GrepInput(BaseModel):
     pattern: str = Field(description="Python regular expression to search for.")
@@ -33,10 +59,12 @@ class Grep(Tool):
     name = "grep"
     klass = ToolClass.READ
     Input = GrepInput
+    concurrent = True
     description = """
     Search file contents with a regular expression. Returns matching lines with
-    their file path and line number. Prefer this over reading many files when you
-    are looking for where something is defined or used.
+    their file path and line number. Binary files are skipped. Prefer this over
+    reading many files when you are looking for where something is defined or
+    used.
     """
 
     async def run(self, inp: GrepInput, ctx: ToolContext) -> ToolResult:
@@ -48,35 +76,51 @@ class Grep(Tool):
         if not root.exists():
             return ToolResult.error(f"Path not found: {inp.path}")
 
+        flags = re.IGNORECASE if inp.ignore_case else 0
         try:
-            regex = re.compile(inp.pattern, re.IGNORECASE if inp.ignore_case else 0)
+            regex = re.compile(inp.pattern, flags)
         except re.error as exc:
             return ToolResult.error(f"Invalid regular expression: {exc}")
+        whole = (
+            None
+            if _LINE_SENSITIVE.search(inp.pattern) or _MAY_CROSS_LINES.search(inp.pattern)
+            else re.compile(inp.pattern, flags | re.M)
+        )
+        base = ctx.workspace.resolve()
 
-        files = [root] if root.is_file() else self._candidates(root, inp.glob)
-
-        hits: list[str] = []
-        scanned = 0
-        for file in files:
-            if len(hits) >= inp.max_results:
-                break
-            scanned += 1
+        # A directory search passes over binary files quietly; naming one
+        # directly deserves an answer that says why nothing came back.
+        if root.is_file():
             try:
-                if file.stat().st_size > MAX_FILE_BYTES:
-                    continue
-                text = file.read_text(encoding="utf-8", errors="replace")
-            except (OSError, ValueError):
-                continue
+                with root.open("rb") as handle:
+                    head = handle.read(BINARY_SNIFF_BYTES)
+            except OSError as exc:
+                return ToolResult.error(f"Could not read {inp.path}: {exc}")
+            if looks_binary(head):
+                return ToolResult.ok(
+                    f"Skipped {inp.path}: it is a binary file.", display="binary file"
+                )
 
-            for number, line in enumerate(text.splitlines(), 1):
-                if regex.search(line):
-                    try:
-                        rel = file.relative_to(ctx.workspace.resolve())
-                    except ValueError:
-                        rel = file
-                    hits.append(f"{rel}:{number}: {line.strip()[:300]}")
-                    if len(hits) >= inp.max_results:
-                        break
+        # Translated once, rather than fnmatch re-normalizing and looking up its
+        # pattern cache for every file name in the tree.
+        wanted = re.compile(fnmatch.translate(inp.glob), _GLOB_FLAGS).match if inp.glob else None
+        files: Iterable[str] = [str(root)] if root.is_file() else self._candidates(root, wanted)
+
+        # Walking and reading are blocking. Left on the event loop, a search of a
+        # large tree would stall everything sharing it -- the MCP transports'
+        # background readers included -- until the last file was scanned.
+        #
+        # A cancelled await does not stop the thread, and asyncio.run waits for
+        # the executor on the way out, so Ctrl-C would hang until the scan
+        # finished. The flag lets the worker give up at the next file.
+        stop = threading.Event()
+        try:
+            hits, scanned = await asyncio.to_thread(
+                _search, files, regex, whole, base, inp.max_results, stop
+            )
+        except asyncio.CancelledError:
+            stop.set()
+            raise
 
         if not hits:
             return ToolResult.ok(
@@ -94,14 +138,127 @@ class Grep(Tool):
         )
 
     @staticmethod
-    def _candidates(root: Path, glob: str) -> list[Path]:
-        out: list[Path] = []
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-            if any(part in SKIP_DIRS for part in path.parts):
-                continue
-            if glob and not fnmatch.fnmatch(path.name, glob):
+    def _candidates(root: Path, wanted: Callable[[str], object] | None) -> Iterator[str]:
+        """Files under ``root``, pruning skipped directories as they are reached.
+
+        Filtering ``rglob`` output afterwards still descends into every
+        node_modules and .git, and checks the whole absolute path, so a
+        workspace that itself lives under a ``build`` directory matched nothing.
+
+        Yields plain path strings: most candidates are opened once and never
+        reported, so building a Path for each is wasted allocation.
+        """
+        pending = [str(root)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                pending.append(entry.path)
+                        elif entry.is_file() and (wanted is None or wanted(entry.name)):
+                            yield entry.path
+            except OSError:
                 continue
-            out.append(path)
-        return out
+
+
+def _search(
+    files: Iterable[str],
+    regex: re.Pattern[str],
+    whole: re.Pattern[str] | None,
+    base: Path,
+    limit: int,
+    stop: threading.Event,
+) -> tuple[list[str], int]:
+    """Formatted hits, up to ``limit``, and the number of files looked at.
+
+    Checks ``stop`` before each file and returns what it has once it is set.
+    """
+    # Everything the walk yields starts with the workspace path, so reporting a
+    # hit relative to it is a slice rather than a Path.relative_to.
+    prefix = os.path.join(str(base), "")
+    hits: list[str] = []
+    scanned = 0
+    for file in files:
+        if len(hits) >= limit or stop.is_set():
+            break
+        scanned += 1
+        try:
+            text = _read_text(file)
+        except (OSError, ValueError):
+            continue
+        if text is None:
+            continue
+
+        rel = file[len(prefix) :] if file.startswith(prefix) else file
+        for number, line in _matching_lines(text, regex, whole):
+            hits.append(f"{rel}:{number}: {line.strip()[:300]}")
+            if len(hits) >= limit:
+                break
+    return hits, scanned
+
+
+def _read_text(path: str) -> str | None:
+    """The file's text, or None when it is binary or over :data:`MAX_FILE_BYTES`.
+
+    One open, an fstat and a single read, rather than a stat by path followed by
+    ``read_text`` and its text-mode buffering -- this runs for every candidate.
+    Line endings are normalized as universal newlines would, so line numbers
+    agree with read_file's.
+
+    Binary files are recognized from their first block, the same sniff read_file
+    uses, before the rest is read: a bundle or an image can only produce
+    replacement-character noise, and would otherwise be read and scanned whole.
+    """
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size > MAX_FILE_BYTES:
+            return None
+        data = handle.read(BINARY_SNIFF_BYTES)
+        if looks_binary(data):
+            return None
+        data += handle.read(MAX_FILE_BYTES + 1 - len(data))
+    if len(data) > MAX_FILE_BYTES:
+        return None  # grew between the fstat and the read
+    text = data.decode("utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _matching_lines(
+    text: str, regex: re.Pattern[str], whole: re.Pattern[str] | None
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(line number, line)`` for every line ``regex`` matches.
+
+    Most files searched contain no match at all, and looping over their lines
+    in Python is what a search spends its time on. ``whole`` -- the same pattern
+    in multiline mode -- lets the regex engine skip from one candidate to the
+    next across the entire text. Each candidate line is still confirmed with
+    ``regex`` itself, so results and numbering are exactly those of checking
+    ``text.splitlines()`` one by one, which stays the fallback whenever the two
+    could disagree, or when the pattern could run across lines and make the
+    whole-file search quadratic.
+    """
+    if whole is None or any(mark in text for mark in _OTHER_BREAKS):
+        for number, line in enumerate(text.splitlines(), 1):
+            if regex.search(line):
+                yield number, line
+        return
+
+    number, counted, pos = 1, 0, 0
+    while (match := whole.search(text, pos)) is not None:
+        start = text.rfind("\n", 0, match.start()) + 1
+        if start >= len(text):
+            break  # past the final newline, where splitlines has no line
+        end = text.find("\n", start)
+        if end < 0:
+            end = len(text)
+        number += text.count("\n", counted, start)
+        counted = start
+        line = text[start:end]
+        # A multiline match may span lines that do not match on their own.
+        if regex.search(line):
+            yield number, line
+        if end == len(text):
+            break
+        pos = end + 1
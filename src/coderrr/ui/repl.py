@@ -15,7 +15,6 @@ from __future__ import annotations
 
 import asyncio
 import sys
-import webbrowser
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -383,6 +382,8 @@ class Repl:
         """Run the OAuth flow for one server. True on success."""
 
         def show(url: str) -> None:
+            import webbrowser
+
             self.ui.info("Opening your browser to authorize...")
             webbrowser.open(url)
             self.ui.print(f"  [dim]If it did not open: {url}[/]")
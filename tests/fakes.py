@@ -85,6 +85,9 @@ class FakeProvider:
 
         return self._emit(turn)
 
+    async def aclose(self) -> None:
+        pass
+
     async def _emit(self, turn: Turn) -> AsyncIterator[StreamEvent]:
         if turn.text:
             # Chunked, so tests exercise the streaming assembly path.
@@ -46,6 +46,43 @@ def test_round_trip(tmp_path: Path) -> None:
     assert loaded.agent.max_iter == 3
 
 
+def test_failed_save_leaves_the_previous_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "config.toml"
+    save_config(Config(), target)
+    before = target.read_bytes()
+
+    def crash(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", crash)
+    config = Config()
+    config.agent.max_iter = 9
+    with pytest.raises(OSError, match="disk full"):
+        save_config(config, target)
+
+    assert target.read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["config.toml"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+def test_save_writes_through_a_symlinked_config(tmp_path: Path) -> None:
+    real = tmp_path / "dotfiles" / "config.toml"
+    real.parent.mkdir()
+    save_config(Config(), real)
+    link = tmp_path / "config.toml"
+    link.symlink_to(real)
+
+    config = Config()
+    config.agent.max_iter = 9
+    save_config(config, link)
+
+    assert link.is_symlink()
+    assert load_config(real).agent.max_iter == 9
+    assert sorted(p.name for p in real.parent.iterdir()) == ["config.toml"]
+
+
 def test_missing_file_yields_defaults(tmp_path: Path) -> None:
     assert load_config(tmp_path / "absent.toml").provider.name == "ollama"
 
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
+from pydantic import BaseModel
+
 from coderrr.agent.loop import run_conversation, run_task
 from coderrr.agent.modes import AgentMode
-from coderrr.llm.types import Message
-from coderrr.tools.base import ToolContext
+from coderrr.llm.types import Message, ToolClass, ToolUseBlock
+from coderrr.tools.base import Tool, ToolContext, ToolResult
 from coderrr.tools.registry import ToolRegistry
-from tests.fakes import FakeProvider, Turn
+from tests.fakes import FakeProvider, RecordingConsole, Turn
 
 
 async def _run(provider, registry, ctx, text="do the thing"):  # type: ignore[no-untyped-def]
@@ -85,6 +90,55 @@ async def test_parallel_tool_calls_in_one_turn(ctx: ToolContext, registry: ToolR
     assert len(results_message.content) == 2
 
 
+class _NoInput(BaseModel):
+    pass
+
+
+class _Rendezvous(Tool):
+    """A read tool that only returns once a second call is running alongside it."""
+
+    name = "rendezvous"
+    klass = ToolClass.READ
+    concurrent = True
+    Input = _NoInput
+    description = "Test tool."
+
+    def __init__(self) -> None:
+        self.arrived = 0
+        self.both = asyncio.Event()
+
+    async def run(self, inp: Any, ctx: ToolContext) -> ToolResult:
+        self.arrived += 1
+        if self.arrived == 2:
+            self.both.set()
+        await asyncio.wait_for(self.both.wait(), timeout=1)
+        return ToolResult.ok(f"met {self.arrived}")
+
+
+async def test_concurrent_tool_calls_run_together(
+    ctx: ToolContext, registry: ToolRegistry, ui: RecordingConsole
+) -> None:
+    registry.register(_Rendezvous())
+    provider = FakeProvider(
+        [
+            Turn(calls=[("rendezvous", {}), ("rendezvous", {}), ("read_file", {"path": "x"})]),
+            Turn(text="done"),
+        ]
+    )
+    await _run(provider, registry, ctx)
+
+    requested = [
+        b.id for b in provider.calls[1].messages[-2].content if isinstance(b, ToolUseBlock)
+    ]
+    blocks = provider.calls[1].messages[-1].content
+    assert [b.content for b in blocks[:2]] == ["met 2", "met 2"]
+    assert [b.tool_use_id for b in blocks] == requested
+
+    # Both batched calls are announced before either result arrives.
+    shown = [line.split()[0] for line in ui.lines if line.startswith(("tool:", "result:"))]
+    assert shown == ["tool:", "tool:", "result:", "result:", "tool:", "result:"]
+
+
 async def test_budget_caps_a_runaway_model(ctx: ToolContext, registry: ToolRegistry) -> None:
     """A model that calls tools forever is stopped by the turn budget."""
     ctx.config.agent.max_tool_turns = 4
@@ -316,8 +316,10 @@ def test_binary_blocks_are_reported_not_inlined() -> None:
 
 
 def test_structured_content_is_used_when_there_is_no_text() -> None:
-    content, _ = render_result(McpCallResult(structured={"count": 2}), server="linear", limit=1024)
-    assert '"count": 2' in content
+    content, _ = render_result(
+        McpCallResult(structured={"count": 2, "owner": "Zoë"}), server="linear", limit=1024
+    )
+    assert '{"count":2,"owner":"Zoë"}' in content
 
 
 def test_oversized_results_are_truncated() -> None:
@@ -749,6 +749,22 @@ def test_the_credentials_file_is_not_world_readable(tmp_path: Path) -> None:
     assert mode == 0o600, f"expected 0600, got {oct(mode)}"
 
 
+def test_an_interrupted_save_keeps_the_other_servers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = store_at(tmp_path)
+    store.save("linear", stored_auth())
+
+    def crash(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", crash)
+    with pytest.raises(OSError, match="disk full"):
+        store.save("notion", stored_auth())
+
+    assert store_at(tmp_path).servers() == ["linear"]
+
+
 def test_unknown_servers_load_as_none(tmp_path: Path) -> None:
     assert store_at(tmp_path).load("nobody") is None
 
@@ -785,6 +801,34 @@ def test_a_corrupt_file_is_ignored_rather_than_fatal(tmp_path: Path) -> None:
     assert store.servers() == []
 
 
+def test_the_file_is_parsed_once_until_it_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = store_at(tmp_path)
+    store.save("linear", stored_auth())
+    store.save("notion", stored_auth())
+
+    parses = 0
+    real_loads = json.loads
+
+    def counting_loads(raw: str) -> Any:
+        nonlocal parses
+        parses += 1
+        return real_loads(raw)
+
+    monkeypatch.setattr(json, "loads", counting_loads)
+    for _ in range(3):
+        assert store.load("linear") is not None
+        assert store.servers() == ["linear", "notion"]
+    assert parses == 0  # what save wrote is already known
+
+    # Another process signing out has to be noticed.
+    store.path.write_text(json.dumps({"notion": {}}), encoding="utf-8")
+    assert store.servers() == ["notion"]
+    assert store.load("linear") is None
+    assert parses == 1
+
+
 def test_where_credentials_live_is_reportable(tmp_path: Path) -> None:
     store = store_at(tmp_path)
     assert store.located_in("linear") == "not stored"
@@ -301,6 +301,36 @@ async def test_anthropic_sends_system_out_of_band() -> None:
     assert "anthropic-version" in route.calls[0].request.headers
 
 
+@respx.mock
+async def test_turns_share_one_connection_pool_until_closed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    opened: list[httpx.AsyncClient] = []
+
+    class RecordingClient(httpx.AsyncClient):
+        def __init__(self, **kwargs: object) -> None:
+            super().__init__(**kwargs)  # type: ignore[arg-type]
+            opened.append(self)
+
+    monkeypatch.setattr(httpx, "AsyncClient", RecordingClient)
+    route = respx.post("https://api.anthropic.com/v1/messages").mock(
+        return_value=httpx.Response(200, text=sse({"type": "message_stop"}))
+    )
+    provider = AnthropicProvider(api_key="k")
+    for _ in range(2):
+        await collect(provider.stream(system="", messages=[], tools=[], model="m"))
+    assert route.call_count == 2
+    assert len(opened) == 1
+
+    await provider.aclose()
+    assert opened[0].is_closed
+    await collect(provider.stream(system="", messages=[], tools=[], model="m"))
+    assert route.call_count == 3
+    assert len(opened) == 2
+    await provider.aclose()
+    assert opened[1].is_closed
+
+
 # -- Google --------------------------------------------------------------
 
 
@@ -165,6 +165,17 @@ def test_update_task_persists(workspace: Path) -> None:
     assert task.notes == "shipped"
 
 
+def test_tasks_only_load_skips_the_prose_documents(workspace: Path) -> None:
+    store = SpecStore(workspace)
+    ref = store.create("X", goal="Ship it")
+    store.write_document(ref, "tasks", CANONICAL)
+
+    spec = store.load(ref, tasks_only=True)
+    assert spec.requirements == spec.design == ""
+    assert spec.tasks == store.load(ref).tasks
+    assert "Ship it" in store.load(ref).requirements
+
+
 def test_update_unknown_task_raises(workspace: Path) -> None:
     store = SpecStore(workspace)
     ref = store.create("X")
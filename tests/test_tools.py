@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from dataclasses import replace
+from pathlib import Path
+
 import pytest
 
 from coderrr.llm.types import ToolClass, ToolUseBlock
 from coderrr.tools.base import ToolContext
+from coderrr.tools.read import search
 from coderrr.tools.registry import ALL_TOOLS, ToolRegistry
 
 
@@ -25,6 +31,12 @@ def test_every_tool_exports_a_valid_schema(tool_cls: type) -> None:
     assert isinstance(spec.klass, ToolClass)
 
 
+def test_schemas_are_built_once_per_input_class() -> None:
+    first, second = ALL_TOOLS[0]().spec(), ALL_TOOLS[0]().spec()
+    assert first.input_schema is second.input_schema
+    assert "title" not in first.input_schema
+
+
 def test_tool_names_are_unique() -> None:
     names = [c.name for c in ALL_TOOLS]
     assert len(names) == len(set(names))
@@ -82,12 +94,130 @@ async def test_grep_finds_matches(registry: ToolRegistry, ctx: ToolContext) -> N
     assert "app.py" in result.content
 
 
+async def test_grep_glob_filters_file_names(registry: ToolRegistry, ctx: ToolContext) -> None:
+    (ctx.workspace / "notes.md").write_text("def greet is documented here\n", encoding="utf-8")
+
+    result = await call(registry, ctx, "grep", pattern=r"def greet", glob="*.md")
+    assert "notes.md" in result.content
+    assert "app.py" not in result.content
+
+
+async def test_grep_skips_binary_files(registry: ToolRegistry, ctx: ToolContext) -> None:
+    (ctx.workspace / "blob.bin").write_bytes(b"\x00\x01def greet\n")
+    result = await call(registry, ctx, "grep", pattern=r"def greet")
+    assert "app.py" in result.content
+    assert "blob.bin" not in result.content
+
+
+async def test_grep_names_a_binary_file_it_was_pointed_at(
+    registry: ToolRegistry, ctx: ToolContext
+) -> None:
+    (ctx.workspace / "blob.bin").write_bytes(b"\x00\x01def greet\n")
+    result = await call(registry, ctx, "grep", pattern=r"def greet", path="blob.bin")
+    assert not result.is_error
+    assert result.content == "Skipped blob.bin: it is a binary file."
+
+
+async def test_grep_skips_dependency_dirs(
+    registry: ToolRegistry, ctx: ToolContext, workspace: Path
+) -> None:
+    vendored = workspace / "node_modules" / "left-pad"
+    vendored.mkdir(parents=True)
+    (vendored / "index.py").write_text("def greet():\n    pass\n", encoding="utf-8")
+
+    result = await call(registry, ctx, "grep", pattern=r"def greet")
+    assert "app.py" in result.content
+    assert "node_modules" not in result.content
+
+
+async def test_grep_workspace_inside_skipped_dir_name(
+    registry: ToolRegistry, ctx: ToolContext, tmp_path: Path
+) -> None:
+    """Only directories under the search root are pruned, never its ancestors."""
+    nested = tmp_path / "build" / "checkout"
+    nested.mkdir(parents=True)
+    (nested / "main.py").write_text("def run():\n    pass\n", encoding="utf-8")
+
+    result = await call(registry, replace(ctx, workspace=nested), "grep", pattern=r"def run")
+    assert "1 match(es)" in result.content
+
+
+async def test_grep_reports_the_same_lines_as_a_line_by_line_scan(
+    registry: ToolRegistry, ctx: ToolContext
+) -> None:
+    (ctx.workspace / "notes.txt").write_text(
+        "alpha\n\nbeta  \nalpha beta\nbeta\n", encoding="utf-8"
+    )
+
+    ends = await call(registry, ctx, "grep", pattern=r"beta$", path="notes.txt")
+    assert ends.content.splitlines()[1:] == ["notes.txt:4: alpha beta", "notes.txt:5: beta"]
+
+    # \s+ can cross a newline in the file as a whole; no single line has it here.
+    spanning = await call(registry, ctx, "grep", pattern=r"alpha\s+beta", path="notes.txt")
+    assert spanning.content.splitlines()[1:] == ["notes.txt:4: alpha beta"]
+
+
+async def test_grep_stays_linear_when_a_repeat_could_cross_lines(
+    registry: ToolRegistry, ctx: ToolContext
+) -> None:
+    # No ")" anywhere: over the whole file, [^)]* would scan to the end from
+    # every position. The negated class has to keep the search line by line.
+    assert search._MAY_CROSS_LINES.search(r"[^)]*\)")
+
+    (ctx.workspace / "open.txt").write_text("call(arg, other\n" * 7000, encoding="utf-8")
+    result = await call(registry, ctx, "grep", pattern=r"[^)]*\)", path="open.txt")
+    assert result.content.startswith("No matches")
+
+
+async def test_cancelled_grep_stops_its_worker_thread(
+    registry: ToolRegistry, ctx: ToolContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for index in range(5):
+        (ctx.workspace / f"file{index}.txt").write_text("text\n", encoding="utf-8")
+    entered, release = threading.Event(), threading.Event()
+    reads: list[str] = []
+    real_read = search._read_text
+
+    def blocking_read(path: str) -> str | None:
+        reads.append(path)
+        entered.set()
+        release.wait(5)
+        return real_read(path)
+
+    monkeypatch.setattr(search, "_read_text", blocking_read)
+    task = asyncio.create_task(call(registry, ctx, "grep", pattern="text"))
+    await asyncio.to_thread(entered.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    release.set()
+    await asyncio.sleep(0.2)
+    assert len(reads) == 1
+
+
+async def test_grep_numbers_crlf_files_like_read_file(
+    registry: ToolRegistry, ctx: ToolContext
+) -> None:
+    (ctx.workspace / "win.txt").write_bytes(b"one\r\ntwo\r\nthree\r\n")
+    result = await call(registry, ctx, "grep", pattern=r"^three$", path="win.txt")
+    assert result.content.splitlines()[1:] == ["win.txt:3: three"]
+
+
 async def test_grep_invalid_regex(registry: ToolRegistry, ctx: ToolContext) -> None:
     result = await call(registry, ctx, "grep", pattern="[unclosed")
     assert result.is_error
     assert "Invalid regular expression" in result.content
 
 
+async def test_list_dir_puts_directories_first_and_skips_dependencies(
+    registry: ToolRegistry, ctx: ToolContext
+) -> None:
+    (ctx.workspace / "node_modules").mkdir()
+    result = await call(registry, ctx, "list_dir")
+    assert result.content.splitlines()[1:] == [".coderrr/", "src/", "README.md (15 bytes)"]
+
+
 async def test_tree_shows_structure(registry: ToolRegistry, ctx: ToolContext) -> None:
     result = await call(registry, ctx, "tree")
     assert not result.is_error